@@ -3,6 +3,7 @@
 Provides CLI commands for syncing markdown files to/from Notion pages.
 """
 
+import asyncio
 import re
 from pathlib import Path
 
@@ -13,6 +14,20 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# First H1 heading in a markdown document, used as the default page title
+H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _format_uuid(hex_id: str) -> str | None:
+    """Format 32 hex digits as a dashed UUID, or None if not valid hex."""
+    hex_id = hex_id.lower()
+    if len(hex_id) != 32 or not HEX_DIGITS.issuperset(hex_id):
+        return None
+    return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+
+
 def normalize_page_id(value: str) -> str | None:
     """Normalize a page ID or extract from URL.
 
@@ -26,16 +41,10 @@ def normalize_page_id(value: str) -> str | None:
     """
     if value.startswith("http"):
         path = value.split("?")[0].split("#")[0]
-        match = re.search(r"([a-f0-9]{32})$", path, re.IGNORECASE)
-        if match:
-            hex_id = match.group(1).lower()
-            return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
-        return None
+        # The page ID is the last 32 characters of the URL path
+        return _format_uuid(path[-32:])
 
-    hex_id = value.replace("-", "").lower()
-    if len(hex_id) == 32 and all(c in "0123456789abcdef" for c in hex_id):
-        return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
-    return None
+    return _format_uuid(value.replace("-", ""))
 
 
 @click.command()
@@ -97,7 +106,7 @@ def md2notion(file: str, page: str | None, parent: str | None, title: str | None
     content = file_path.read_text(encoding="utf-8")
 
     if not title:
-        h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        h1_match = H1_RE.search(content)
         if h1_match:
             title = h1_match.group(1).strip()
         else:
@@ -165,8 +174,7 @@ def notion2md(page: str, output: str | None):
     title = client.get_page_title(page_id)
 
     # Get page content
-    blocks = client.get_block_children(page_id)
-    blocks = _fetch_nested_children(client, blocks)
+    blocks = asyncio.run(_fetch_page_blocks(client, page_id))
 
     markdown = blocks_to_markdown(blocks)
 
@@ -181,18 +189,33 @@ def notion2md(page: str, output: str | None):
         click.echo(markdown)
 
 
-def _fetch_nested_children(client, blocks: list) -> list:
-    """Recursively fetch children for blocks that have has_children=True."""
-    for block in blocks:
-        if block.get("has_children"):
-            block_type = block.get("type")
-            block_id = block.get("id")
+async def _fetch_page_blocks(client, page_id: str) -> list:
+    """Fetch all blocks of a page, including nested children."""
+    try:
+        blocks = await client.aget_block_children(page_id)
+        return await _fetch_nested_children_async(client, blocks)
+    finally:
+        await client.aclose()
+
 
-            children = client.get_block_children(block_id)
-            children = _fetch_nested_children(client, children)
+async def _fetch_nested_children_async(client, blocks: list) -> list:
+    """Fetch children for blocks that have has_children=True.
 
+    Works breadth-first: the children of every block on one nesting level
+    are requested as one concurrent batch, so the number of round trips
+    follows the nesting depth rather than the number of nested blocks.
+    """
+    level = [b for b in blocks if b.get("has_children")]
+
+    while level:
+        batches = await client.abatch_get_children([b.get("id") for b in level])
+        next_level = []
+        for block, children in zip(level, batches):
+            block_type = block.get("type")
             if block_type in block:
                 block[block_type]["children"] = children
+                next_level.extend(c for c in children if c.get("has_children"))
+        level = next_level
 
     return blocks
 
@@ -206,12 +229,7 @@ def _extract_id_from_url(url: str) -> str:
     if not url:
         return ""
     # URL format: https://www.notion.so/32charHexId or https://www.notion.so/Title-32charHexId
-    import re
-    match = re.search(r'([a-f0-9]{32})$', url, re.IGNORECASE)
-    if match:
-        hex_id = match.group(1).lower()
-        return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
-    return ""
+    return _format_uuid(url[-32:]) or ""
 
 
 def _extract_title(item: dict) -> str:
@@ -6,12 +6,14 @@ Provides a high-level client for Notion API operations with:
 - Pagination handling
 """
 
+import asyncio
+import inspect
 import os
 import time
 from functools import wraps
 from typing import Any, Callable
 
-from notion_client import Client
+from notion_client import AsyncClient, Client
 from notion_client.errors import HTTPResponseError
 
 from marknotion.md2notion import markdown_to_blocks
@@ -37,15 +39,48 @@ class CloudflareWAFError(Exception):
         )
 
 
+def _is_retryable(error: HTTPResponseError) -> bool:
+    """Check whether an API error is transient (429, 5xx).
+
+    Raises:
+        CloudflareWAFError: If the request was blocked by Cloudflare.
+    """
+    if error.status == 403 and "Cloudflare" in str(error.body):
+        raise CloudflareWAFError(error.body) from error
+    return error.status in (429, 500, 502, 503, 504)
+
+
 def retry_on_error(
     max_retries: int = 5,
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     on_retry: Callable[[Exception, int, float], None] | None = None,
 ):
-    """Decorator for retrying on transient errors (429, 5xx)."""
+    """Decorator for retrying on transient errors (429, 5xx).
+
+    Works with both regular functions and coroutine functions.
+    """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                delay = initial_delay
+                for attempt in range(1, max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except HTTPResponseError as e:
+                        if not _is_retryable(e) or attempt == max_retries:
+                            raise
+                        if on_retry:
+                            on_retry(e, attempt, delay)
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, max_delay)
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             delay = initial_delay
@@ -53,9 +88,7 @@ def retry_on_error(
                 try:
                     return func(*args, **kwargs)
                 except HTTPResponseError as e:
-                    if e.status == 403 and "Cloudflare" in str(e.body):
-                        raise CloudflareWAFError(e.body) from e
-                    if e.status not in (429, 500, 502, 503, 504) or attempt == max_retries:
+                    if not _is_retryable(e) or attempt == max_retries:
                         raise
                     if on_retry:
                         on_retry(e, attempt, delay)
@@ -104,8 +137,19 @@ class NotionClient:
                 "To create a token, visit: https://www.notion.so/my-integrations"
             )
         self.client = Client(auth=self.token)
+        self._async_client: AsyncClient | None = None
         self._on_retry = on_retry
 
+    @property
+    def async_client(self) -> AsyncClient:
+        """Async Notion client, created on first use.
+
+        Sync-only callers never open its connection pool.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncClient(auth=self.token)
+        return self._async_client
+
     def search(
         self,
         query: str,
@@ -198,6 +242,63 @@ class NotionClient:
 
         return results
 
+    @retry_on_error(on_retry=_default_on_retry)
+    async def aget_block_children(self, block_id: str) -> list[dict[str, Any]]:
+        """Get all child blocks of a block/page asynchronously.
+
+        Args:
+            block_id: Block or page ID
+
+        Returns:
+            List of all block objects
+        """
+        results = []
+        has_more = True
+        start_cursor = None
+
+        while has_more:
+            params: dict[str, Any] = {"block_id": block_id}
+            if start_cursor:
+                params["start_cursor"] = start_cursor
+
+            response = await self.async_client.blocks.children.list(**params)
+            results.extend(response.get("results", []))
+            has_more = response.get("has_more", False)
+            start_cursor = response.get("next_cursor")
+
+        return results
+
+    async def abatch_get_children(
+        self,
+        block_ids: list[str],
+        max_concurrency: int = 3,
+    ) -> list[list[dict[str, Any]]]:
+        """Get the child blocks of several blocks/pages concurrently.
+
+        Args:
+            block_ids: Block or page IDs
+            max_concurrency: Max requests in flight (Notion rate-limits per integration)
+
+        Returns:
+            One list of child blocks per ID, in the same order as block_ids
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(block_id: str) -> list[dict[str, Any]]:
+            async with limit:
+                return await self.aget_block_children(block_id)
+
+        return await asyncio.gather(*(fetch(block_id) for block_id in block_ids))
+
+    async def aclose(self) -> None:
+        """Close the async API client, if open.
+
+        A later async call opens a new one, so the client stays usable.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     @retry_on_error(on_retry=_default_on_retry)
     def append_blocks(self, page_id: str, children: list[dict[str, Any]]) -> dict[str, Any]:
         """Append blocks to a page.
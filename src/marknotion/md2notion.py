@@ -1,6 +1,8 @@
 """Markdown to Notion blocks converter."""
 
 import re
+import threading
+from typing import Callable
 
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
@@ -14,6 +16,25 @@ from mdit_py_plugins.admon import admon_plugin
 FRONT_MATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
 
+def _make_parser() -> MarkdownIt:
+    """Create the markdown-it parser with all extensions we convert."""
+    md = MarkdownIt("commonmark")
+    md.enable("strikethrough")
+    md.enable("table")
+    md.use(tasklists_plugin)
+    md.use(dollarmath_plugin, allow_space=True, allow_digits=True)
+    md.use(admon_plugin)
+    md.use(footnote_plugin)
+    return md
+
+
+# Building the rule chains is costly, so the parser is created once and
+# reused. markdown-it-py does not document parse() as thread-safe, so
+# calls are serialized through a lock.
+_MD = _make_parser()
+_MD_LOCK = threading.Lock()
+
+
 def _extract_front_matter(markdown: str) -> tuple[str | None, str]:
     """Extract YAML front matter from markdown.
 
@@ -35,7 +56,7 @@ def _make_toggle_block(title: str, children: list[dict]) -> dict:
         "object": "block",
         "type": "toggle",
         "toggle": {
-            "rich_text": [_make_rich_text(title, {}, None)],
+            "rich_text": [_make_rich_text(title)],
             "children": children,
         },
     }
@@ -60,14 +81,8 @@ def markdown_to_blocks(markdown: str) -> list[dict]:
         toggle_block = _make_toggle_block("📋 Front Matter", [code_block])
         blocks.append(toggle_block)
 
-    md = MarkdownIt("commonmark")
-    md.enable("strikethrough")
-    md.enable("table")
-    md.use(tasklists_plugin)
-    md.use(dollarmath_plugin, allow_space=True, allow_digits=True)
-    md.use(admon_plugin)
-    md.use(footnote_plugin)
-    tokens = md.parse(markdown)
+    with _MD_LOCK:
+        tokens = _MD.parse(markdown)
     blocks.extend(_tokens_to_blocks(tokens))
 
     return blocks
@@ -77,163 +92,195 @@ def _tokens_to_blocks(tokens: list[Token]) -> list[dict]:
     """Convert markdown-it tokens to Notion blocks."""
     blocks: list[dict] = []
     i = 0
+    n = len(tokens)
 
-    while i < len(tokens):
-        token = tokens[i]
+    while i < n:
+        handler = _BLOCK_HANDLERS.get(tokens[i].type)
+        i = handler(tokens, i, blocks) if handler else i + 1
 
-        if token.type == "heading_open":
-            level = int(token.tag[1])  # h1 -> 1, h2 -> 2, etc.
-            # Next token is inline content
-            inline_token = tokens[i + 1]
-            rich_text = _inline_to_rich_text(inline_token.children or [])
-            blocks.append(_make_heading_block(level, rich_text))
-            i += 3  # heading_open, inline, heading_close
+    return blocks
 
-        elif token.type == "paragraph_open":
-            inline_token = tokens[i + 1]
-            rich_text = _inline_to_rich_text(inline_token.children or [])
-            blocks.append(_make_paragraph_block(rich_text))
-            i += 3  # paragraph_open, inline, paragraph_close
 
-        elif token.type == "bullet_list_open":
-            # Collect all list items until bullet_list_close
-            list_blocks, consumed = _parse_list(tokens[i:], "bulleted_list_item")
-            blocks.extend(list_blocks)
-            i += consumed
-
-        elif token.type == "ordered_list_open":
-            list_blocks, consumed = _parse_list(tokens[i:], "numbered_list_item")
-            blocks.extend(list_blocks)
-            i += consumed
-
-        elif token.type == "fence":
-            language = token.info or "plain text"
-            content = token.content.rstrip("\n")
-            blocks.append(_make_code_block(content, language))
-            i += 1
+# Block token handlers. Each takes (tokens, i, blocks), appends any blocks
+# produced by the token at index i and returns the index of the next token.
 
-        elif token.type == "code_block":
-            content = token.content.rstrip("\n")
-            blocks.append(_make_code_block(content, "plain text"))
-            i += 1
 
-        elif token.type == "blockquote_open":
-            quote_blocks, consumed = _parse_blockquote(tokens[i:])
-            blocks.extend(quote_blocks)
-            i += consumed
+def _handle_heading(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    level = int(tokens[i].tag[1])  # h1 -> 1, h2 -> 2, etc.
+    # Next token is inline content
+    rich_text = _inline_to_rich_text(tokens[i + 1].children or [])
+    blocks.append(_make_heading_block(level, rich_text))
+    return i + 3  # heading_open, inline, heading_close
 
-        elif token.type == "hr":
-            blocks.append(_make_divider_block())
-            i += 1
 
-        elif token.type == "table_open":
-            table_block, consumed = _parse_table(tokens[i:])
-            if table_block:
-                blocks.append(table_block)
-            i += consumed
+def _handle_paragraph(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    rich_text = _inline_to_rich_text(tokens[i + 1].children or [])
+    blocks.append(_make_paragraph_block(rich_text))
+    return i + 3  # paragraph_open, inline, paragraph_close
 
-        elif token.type == "math_block":
-            expression = token.content.strip()
-            blocks.append(_make_equation_block(expression))
-            i += 1
 
-        elif token.type == "admonition_open":
-            admon_block, consumed = _parse_admonition(tokens[i:])
-            if admon_block:
-                blocks.append(admon_block)
-            i += consumed
+def _handle_list(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    # Collect all list items until the matching list close
+    list_blocks, next_i = _parse_list(tokens, i, LIST_ITEM_TYPES[tokens[i].type])
+    blocks.extend(list_blocks)
+    return next_i
 
-        elif token.type == "footnote_block_open":
-            footnote_blocks, consumed = _parse_footnote_block(tokens[i:])
-            blocks.extend(footnote_blocks)
-            i += consumed
 
-        else:
-            i += 1
+def _handle_fence(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    token = tokens[i]
+    language = token.info or "plain text"
+    blocks.append(_make_code_block(token.content.rstrip("\n"), language))
+    return i + 1
 
-    return blocks
 
+def _handle_code_block(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    blocks.append(_make_code_block(tokens[i].content.rstrip("\n"), "plain text"))
+    return i + 1
 
-def _parse_list(tokens: list[Token], list_type: str) -> tuple[list[dict], int]:
-    """Parse a list (bullet or ordered) and return blocks and consumed count.
 
-    Supports task lists (checkboxes) and nested lists.
-    """
-    blocks: list[dict] = []
-    i = 1  # Skip the list_open token
-    depth = 1
+def _handle_blockquote(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    quote_blocks, next_i = _parse_blockquote(tokens, i)
+    blocks.extend(quote_blocks)
+    return next_i
 
-    while i < len(tokens) and depth > 0:
-        token = tokens[i]
 
-        if token.type in ("bullet_list_open", "ordered_list_open"):
-            depth += 1
-            i += 1
-        elif token.type in ("bullet_list_close", "ordered_list_close"):
-            depth -= 1
-            i += 1
-        elif token.type == "list_item_open" and depth == 1:
-            # Check if this is a task list item
-            is_task = token.attrGet("class") == "task-list-item"
-            is_checked = False
+def _handle_hr(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    blocks.append(_make_divider_block())
+    return i + 1
 
-            i += 1
-            item_rich_text: list[dict] = []
-            children_blocks: list[dict] = []
 
-            while i < len(tokens) and tokens[i].type != "list_item_close":
-                if tokens[i].type == "paragraph_open":
-                    inline_token = tokens[i + 1]
-                    inline_children = inline_token.children or []
-
-                    # Check for checkbox in task list (html_inline token)
-                    if is_task and inline_children:
-                        first_child = inline_children[0]
-                        if first_child.type == "html_inline" and "checkbox" in first_child.content:
-                            is_checked = 'checked="checked"' in first_child.content
-                            # Skip the checkbox token and leading space in next token
-                            inline_children = inline_children[1:]
-                            # Remove leading space from text
-                            if inline_children and inline_children[0].type == "text":
-                                inline_children[0].content = inline_children[0].content.lstrip()
-
-                    item_rich_text = _inline_to_rich_text(inline_children)
-                    i += 3
-                elif tokens[i].type in ("bullet_list_open", "ordered_list_open"):
-                    # Nested list - parse recursively
-                    nested_type = "bulleted_list_item" if tokens[i].type == "bullet_list_open" else "numbered_list_item"
-                    nested_blocks, consumed = _parse_list(tokens[i:], nested_type)
-                    children_blocks.extend(nested_blocks)
-                    i += consumed
-                else:
-                    i += 1
+def _handle_table(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    table_block, next_i = _parse_table(tokens, i)
+    if table_block:
+        blocks.append(table_block)
+    return next_i
+
+
+def _handle_math_block(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    blocks.append(_make_equation_block(tokens[i].content.strip()))
+    return i + 1
+
+
+def _handle_admonition(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    admon_block, next_i = _parse_admonition(tokens, i)
+    if admon_block:
+        blocks.append(admon_block)
+    return next_i
+
+
+def _handle_footnote_block(tokens: list[Token], i: int, blocks: list[dict]) -> int:
+    footnote_blocks, next_i = _parse_footnote_block(tokens, i)
+    blocks.extend(footnote_blocks)
+    return next_i
+
+
+# Dispatch table: block-level token type -> handler
+_BLOCK_HANDLERS: dict[str, Callable[[list[Token], int, list[dict]], int]] = {
+    "heading_open": _handle_heading,
+    "paragraph_open": _handle_paragraph,
+    "bullet_list_open": _handle_list,
+    "ordered_list_open": _handle_list,
+    "fence": _handle_fence,
+    "code_block": _handle_code_block,
+    "blockquote_open": _handle_blockquote,
+    "hr": _handle_hr,
+    "table_open": _handle_table,
+    "math_block": _handle_math_block,
+    "admonition_open": _handle_admonition,
+    "footnote_block_open": _handle_footnote_block,
+}
+
+
+# List open token type -> Notion block type of its items
+LIST_ITEM_TYPES: dict[str, str] = {
+    "bullet_list_open": "bulleted_list_item",
+    "ordered_list_open": "numbered_list_item",
+}
+
 
-            if item_rich_text or is_task:
-                if is_task:
-                    block = _make_todo_block(item_rich_text, is_checked)
+def _parse_list(
+    tokens: list[Token], start: int, list_type: str
+) -> tuple[list[dict], int]:
+    """Parse a list (bullet or ordered) starting at tokens[start].
+
+    Returns the list blocks and the index of the token after the list.
+
+    Supports task lists (checkboxes) and nested lists. Nesting is handled in
+    a single pass with explicit stacks: `lists` holds the item type and the
+    destination of every open list, `items` the state of every open item.
+    """
+    blocks: list[dict] = []
+    lists: list[tuple[str, list[dict]]] = [(list_type, blocks)]
+    items: list[dict] = []
+    i = start + 1  # Skip the list_open token
+    n = len(tokens)
+
+    while i < n and lists:
+        token = tokens[i]
+        token_type = token.type
+
+        if token_type in LIST_ITEM_TYPES:
+            # Nested list - its items become children of the enclosing item
+            destination = items[-1]["children"] if items else blocks
+            lists.append((LIST_ITEM_TYPES[token_type], destination))
+        elif token_type in ("bullet_list_close", "ordered_list_close"):
+            lists.pop()
+        elif token_type == "list_item_open":
+            items.append({
+                # Check if this is a task list item
+                "is_task": token.attrGet("class") == "task-list-item",
+                "is_checked": False,
+                "rich_text": [],
+                "children": [],
+            })
+        elif token_type == "list_item_close":
+            item = items.pop()
+            item_type, destination = lists[-1]
+
+            if item["rich_text"] or item["is_task"]:
+                if item["is_task"]:
+                    block = _make_todo_block(item["rich_text"], item["is_checked"])
                 else:
-                    block = _make_list_item_block(list_type, item_rich_text)
+                    block = _make_list_item_block(item_type, item["rich_text"])
 
                 # Add nested children
-                if children_blocks:
-                    block[block["type"]]["children"] = children_blocks
+                if item["children"]:
+                    block[block["type"]]["children"] = item["children"]
+
+                destination.append(block)
+        elif token_type == "paragraph_open" and items:
+            item = items[-1]
+            inline_children = tokens[i + 1].children or []
+
+            # Check for checkbox in task list (html_inline token)
+            if item["is_task"] and inline_children:
+                first_child = inline_children[0]
+                if first_child.type == "html_inline" and "checkbox" in first_child.content:
+                    item["is_checked"] = 'checked="checked"' in first_child.content
+                    # Skip the checkbox token and leading space in next token
+                    inline_children = inline_children[1:]
+                    # Remove leading space from text
+                    if inline_children and inline_children[0].type == "text":
+                        inline_children[0].content = inline_children[0].content.lstrip()
+
+            item["rich_text"] = _inline_to_rich_text(inline_children)
+            i += 3  # paragraph_open, inline, paragraph_close
+            continue
 
-                blocks.append(block)
-            i += 1  # Skip list_item_close
-        else:
-            i += 1
+        i += 1
 
     return blocks, i
 
 
-def _parse_blockquote(tokens: list[Token]) -> tuple[list[dict], int]:
-    """Parse a blockquote and return blocks and consumed count."""
+def _parse_blockquote(tokens: list[Token], start: int) -> tuple[list[dict], int]:
+    """Parse a blockquote and return blocks and the index of the next token."""
     blocks: list[dict] = []
-    i = 1  # Skip blockquote_open
+    i = start + 1  # Skip blockquote_open
     depth = 1
     quote_text: list[dict] = []
+    n = len(tokens)
 
-    while i < len(tokens) and depth > 0:
+    while i < n and depth > 0:
         token = tokens[i]
 
         if token.type == "blockquote_open":
@@ -256,56 +303,86 @@ def _parse_blockquote(tokens: list[Token]) -> tuple[list[dict], int]:
     return blocks, i
 
 
+# Inline open/close tokens -> (annotation name, whether it is switched on)
+_INLINE_MARKS: dict[str, tuple[str, bool]] = {
+    "strong_open": ("bold", True),
+    "strong_close": ("bold", False),
+    "em_open": ("italic", True),
+    "em_close": ("italic", False),
+    "s_open": ("strikethrough", True),
+    "s_close": ("strikethrough", False),
+}
+
+
 def _inline_to_rich_text(tokens: list[Token]) -> list[dict]:
     """Convert inline tokens to Notion rich_text array."""
+    # Fast path: most paragraphs and headings are a single unformatted run.
+    # Same shape as _make_rich_text(content).
+    if len(tokens) == 1 and tokens[0].type == "text":
+        content = tokens[0].content
+        if not content:
+            return []
+        return [{
+            "type": "text",
+            "text": {"content": content},
+            "plain_text": content,
+            "href": None,
+        }]
+
     rich_text: list[dict] = []
     annotations: dict = {}
     link_href: str | None = None
 
     for token in tokens:
-        if token.type == "text":
+        token_type = token.type
+        if token_type == "text":
             if token.content:  # Skip empty text tokens
-                rich_text.append(_make_rich_text(token.content, annotations.copy(), link_href))
-        elif token.type == "code_inline":
-            rich_text.append(_make_rich_text(token.content, {"code": True}, None))
-        elif token.type == "strong_open":
-            annotations["bold"] = True
-        elif token.type == "strong_close":
-            annotations.pop("bold", None)
-        elif token.type == "em_open":
-            annotations["italic"] = True
-        elif token.type == "em_close":
-            annotations.pop("italic", None)
-        elif token.type == "s_open":
-            annotations["strikethrough"] = True
-        elif token.type == "s_close":
-            annotations.pop("strikethrough", None)
-        elif token.type == "link_open":
-            link_href = token.attrGet("href")
-        elif token.type == "link_close":
+                rich_text.append(_make_rich_text(token.content, annotations, link_href))
+        elif token_type in _INLINE_MARKS:
+            # Rebind instead of mutating: emitted rich_text items share the
+            # current annotations dict, so it must never change in place.
+            name, enabled = _INLINE_MARKS[token_type]
+            if enabled:
+                annotations = {**annotations, name: True}
+            else:
+                annotations = {k: v for k, v in annotations.items() if k != name}
+        elif token_type == "code_inline":
+            rich_text.append(_make_rich_text(token.content, {"code": True}))
+        elif token_type == "link_open":
+            link_href = _attr(token, "href") or None
+        elif token_type == "link_close":
             link_href = None
-        elif token.type == "softbreak":
-            rich_text.append(_make_rich_text("\n", {}, None))
-        elif token.type == "hardbreak":
-            rich_text.append(_make_rich_text("\n", {}, None))
-        elif token.type == "image":
+        elif token_type in ("softbreak", "hardbreak"):
+            rich_text.append(_make_rich_text("\n"))
+        elif token_type == "image":
             # Images in inline context - add alt text as link
-            alt = token.attrGet("alt") or token.content or "image"
-            src = token.attrGet("src") or ""
-            rich_text.append(_make_rich_text(alt, {}, src))
-        elif token.type == "math_inline":
+            alt = _attr(token, "alt") or token.content or "image"
+            src = _attr(token, "src")
+            rich_text.append(_make_rich_text(alt, href=src))
+        elif token_type == "math_inline":
             # Inline math - wrap in equation notation
             rich_text.append(_make_equation_rich_text(token.content))
-        elif token.type == "footnote_ref":
+        elif token_type == "footnote_ref":
             # Footnote reference - add as superscript-style text
             label = token.meta.get("label", "?") if token.meta else "?"
-            rich_text.append(_make_rich_text(f"[{label}]", {}, None))
+            rich_text.append(_make_rich_text(f"[{label}]"))
 
     return rich_text
 
 
-def _make_rich_text(content: str, annotations: dict, href: str | None) -> dict:
-    """Create a Notion rich_text object."""
+def _attr(token: Token, name: str) -> str:
+    """Get a token attribute as a string, or "" if it is not set."""
+    value = token.attrGet(name)
+    return "" if value is None else str(value)
+
+
+def _make_rich_text(
+    content: str, annotations: dict | None = None, href: str | None = None
+) -> dict:
+    """Create a Notion rich_text object.
+
+    Annotations are omitted unless given, so plain runs need no empty dict.
+    """
     text_obj: dict = {"content": content}
     # Skip anchor links (starting with #) - Notion doesn't support them
     valid_href = href if href and not href.startswith("#") else None
@@ -335,11 +412,13 @@ def _make_paragraph_block(rich_text: list[dict]) -> dict:
     }
 
 
+# Notion only supports heading_1, heading_2, heading_3
+HEADING_TYPES = ("heading_1", "heading_2", "heading_3")
+
+
 def _make_heading_block(level: int, rich_text: list[dict]) -> dict:
     """Create a Notion heading block."""
-    # Notion only supports heading_1, heading_2, heading_3
-    level = min(level, 3)
-    heading_type = f"heading_{level}"
+    heading_type = HEADING_TYPES[min(level, 3) - 1]
     return {
         "object": "block",
         "type": heading_type,
@@ -451,11 +530,11 @@ def _make_code_block(content: str, language: str) -> dict:
     rich_text_items = []
 
     for chunk in _split_by_utf16_len(content, max_len):
-        rich_text_items.append(_make_rich_text(chunk, {}, None))
+        rich_text_items.append(_make_rich_text(chunk))
 
     # Ensure at least one item (even if empty)
     if not rich_text_items:
-        rich_text_items = [_make_rich_text("", {}, None)]
+        rich_text_items = [_make_rich_text("")]
 
     return {
         "object": "block",
@@ -544,7 +623,7 @@ def _make_callout_block(admon_type: str, title: str, rich_text: list[dict]) -> d
 
     # If title exists and differs from type, prepend it
     if title and title.lower() != admon_type.lower():
-        title_text = _make_rich_text(f"{title}: ", {"bold": True}, None)
+        title_text = _make_rich_text(f"{title}: ", {"bold": True})
         rich_text = [title_text] + rich_text
 
     return {
@@ -568,7 +647,7 @@ def _make_image_block(url: str, caption: str = "") -> dict:
         },
     }
     if caption:
-        block["image"]["caption"] = [_make_rich_text(caption, {}, None)]
+        block["image"]["caption"] = [_make_rich_text(caption)]
     return block
 
 
@@ -606,9 +685,9 @@ def _make_table_block(rows: list[list[list[dict]]], has_header: bool = True) ->
     }
 
 
-def _parse_admonition(tokens: list[Token]) -> tuple[dict | None, int]:
-    """Parse an admonition/callout block."""
-    i = 0
+def _parse_admonition(tokens: list[Token], start: int) -> tuple[dict | None, int]:
+    """Parse an admonition/callout block and return it with the next token index."""
+    i = start
     token = tokens[i]
 
     # Get admonition type and title from meta
@@ -617,14 +696,15 @@ def _parse_admonition(tokens: list[Token]) -> tuple[dict | None, int]:
 
     title = ""
     content_rich_text: list[dict] = []
+    n = len(tokens)
 
-    while i < len(tokens) and tokens[i].type != "admonition_close":
+    while i < n and tokens[i].type != "admonition_close":
         if tokens[i].type == "admonition_title_open":
             i += 1
-            if i < len(tokens) and tokens[i].type == "inline":
+            if i < n and tokens[i].type == "inline":
                 title = tokens[i].content
                 i += 1
-            if i < len(tokens) and tokens[i].type == "admonition_title_close":
+            if i < n and tokens[i].type == "admonition_title_close":
                 i += 1
         elif tokens[i].type == "paragraph_open":
             inline_token = tokens[i + 1]
@@ -639,18 +719,19 @@ def _parse_admonition(tokens: list[Token]) -> tuple[dict | None, int]:
     return _make_callout_block(admon_type, title, content_rich_text), i
 
 
-def _parse_footnote_block(tokens: list[Token]) -> tuple[list[dict], int]:
+def _parse_footnote_block(tokens: list[Token], start: int) -> tuple[list[dict], int]:
     """Parse footnote block and return as quote blocks with footnote prefix."""
     blocks: list[dict] = []
-    i = 1  # Skip footnote_block_open
+    i = start + 1  # Skip footnote_block_open
+    n = len(tokens)
 
-    while i < len(tokens) and tokens[i].type != "footnote_block_close":
+    while i < n and tokens[i].type != "footnote_block_close":
         if tokens[i].type == "footnote_open":
             label = tokens[i].meta.get("label", "?") if tokens[i].meta else "?"
             i += 1
 
             footnote_content: list[dict] = []
-            while i < len(tokens) and tokens[i].type != "footnote_close":
+            while i < n and tokens[i].type != "footnote_close":
                 if tokens[i].type == "paragraph_open":
                     inline_token = tokens[i + 1]
                     # Filter out footnote_anchor tokens
@@ -664,7 +745,7 @@ def _parse_footnote_block(tokens: list[Token]) -> tuple[list[dict], int]:
 
             # Create footnote as a callout with footnote icon
             if footnote_content:
-                prefix_text = _make_rich_text(f"[{label}] ", {"bold": True}, None)
+                prefix_text = _make_rich_text(f"[{label}] ", {"bold": True})
                 blocks.append(_make_callout_block(
                     "footnote",
                     f"Footnote {label}",
@@ -678,14 +759,15 @@ def _parse_footnote_block(tokens: list[Token]) -> tuple[list[dict], int]:
     return blocks, i
 
 
-def _parse_table(tokens: list[Token]) -> tuple[dict | None, int]:
-    """Parse a table and return block and consumed count."""
+def _parse_table(tokens: list[Token], start: int) -> tuple[dict | None, int]:
+    """Parse a table and return block and the index of the next token."""
     rows: list[list[list[dict]]] = []
-    i = 1  # Skip table_open
+    i = start + 1  # Skip table_open
     has_header = False
     current_row: list[list[dict]] = []
+    n = len(tokens)
 
-    while i < len(tokens) and tokens[i].type != "table_close":
+    while i < n and tokens[i].type != "table_close":
         token = tokens[i]
 
         if token.type == "thead_open":
@@ -1,5 +1,13 @@
 """Notion blocks to Markdown converter."""
 
+import io
+from functools import partial
+from typing import Callable
+
+
+# Consecutive blocks of these types are rendered without a blank line between
+LIST_BLOCK_TYPES = frozenset({"bulleted_list_item", "numbered_list_item", "to_do"})
+
 
 def blocks_to_markdown(blocks: list[dict], indent: int = 0) -> str:
     """Convert a list of Notion block objects to Markdown text.
@@ -11,127 +19,131 @@ def blocks_to_markdown(blocks: list[dict], indent: int = 0) -> str:
     Returns:
         Markdown text.
     """
-    lines: list[str] = []
+    buf = io.StringIO()
     prev_type: str | None = None
-    indent_str = "    " * indent  # 4 spaces per level
 
     for block in blocks:
         block_type = block.get("type", "")
         content = _block_to_markdown(block, indent)
+        if not content:
+            continue
 
         # Add blank line between different block types (except consecutive list items)
-        if prev_type and content:
-            is_list_continuation = (
-                prev_type in ("bulleted_list_item", "numbered_list_item", "to_do")
-                and block_type in ("bulleted_list_item", "numbered_list_item", "to_do")
-            )
-            if not is_list_continuation:
-                lines.append("")
-
-        if content:
-            lines.append(content)
-            prev_type = block_type
+        if prev_type:
+            if prev_type in LIST_BLOCK_TYPES and block_type in LIST_BLOCK_TYPES:
+                buf.write("\n")
+            else:
+                buf.write("\n\n")
 
-    return "\n".join(lines)
+        buf.write(content)
+        prev_type = block_type
+
+    return buf.getvalue()
 
 
 def _block_to_markdown(block: dict, indent: int = 0) -> str:
     """Convert a single Notion block to Markdown."""
     block_type = block.get("type", "")
-    data = block.get(block_type, {})
+    renderer = _BLOCK_RENDERERS.get(block_type)
+    if renderer is None:
+        return ""
+    return renderer(block.get(block_type, {}), indent)
+
+
+# Block renderers. Each takes the block's type-specific data and the
+# indentation level, and returns the block's Markdown.
+
+
+def _render_paragraph(data: dict, indent: int) -> str:
+    text = _rich_text_to_markdown(data.get("rich_text", []))
+    return f"{'    ' * indent}{text}"
+
+
+def _render_heading(marker: str, data: dict, indent: int) -> str:
+    text = _rich_text_to_markdown(data.get("rich_text", []))
+    return f"{'    ' * indent}{marker} {text}"
+
+
+def _render_list_item(marker: str, data: dict, indent: int) -> str:
+    text = _rich_text_to_markdown(data.get("rich_text", []))
+    result = f"{'    ' * indent}{marker} {text}"
+    # Handle nested children
+    children = data.get("children", [])
+    if children:
+        child_md = blocks_to_markdown(children, indent + 1)
+        result += "\n" + child_md
+    return result
+
+
+def _render_to_do(data: dict, indent: int) -> str:
+    marker = "- [x]" if data.get("checked", False) else "- [ ]"
+    return _render_list_item(marker, data, indent)
+
+
+def _render_code(data: dict, indent: int) -> str:
     indent_str = "    " * indent
+    text = _rich_text_to_markdown(data.get("rich_text", []))
+    language = data.get("language", "")
+    if language == "plain text":
+        language = ""
+    return f"{indent_str}```{language}\n{text}\n{indent_str}```"
 
-    if block_type == "paragraph":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        return f"{indent_str}{text}"
-
-    elif block_type == "heading_1":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        return f"{indent_str}# {text}"
-
-    elif block_type == "heading_2":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        return f"{indent_str}## {text}"
-
-    elif block_type == "heading_3":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        return f"{indent_str}### {text}"
-
-    elif block_type == "bulleted_list_item":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        result = f"{indent_str}- {text}"
-        # Handle nested children
-        children = data.get("children", [])
-        if children:
-            child_md = blocks_to_markdown(children, indent + 1)
-            result += "\n" + child_md
-        return result
-
-    elif block_type == "numbered_list_item":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        result = f"{indent_str}1. {text}"
-        # Handle nested children
-        children = data.get("children", [])
-        if children:
-            child_md = blocks_to_markdown(children, indent + 1)
-            result += "\n" + child_md
-        return result
-
-    elif block_type == "to_do":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        checked = data.get("checked", False)
-        checkbox = "[x]" if checked else "[ ]"
-        result = f"{indent_str}- {checkbox} {text}"
-        # Handle nested children
-        children = data.get("children", [])
-        if children:
-            child_md = blocks_to_markdown(children, indent + 1)
-            result += "\n" + child_md
-        return result
-
-    elif block_type == "code":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        language = data.get("language", "")
-        if language == "plain text":
-            language = ""
-        return f"{indent_str}```{language}\n{text}\n{indent_str}```"
-
-    elif block_type == "quote":
-        text = _rich_text_to_markdown(data.get("rich_text", []))
-        lines = text.split("\n")
-        return "\n".join(f"{indent_str}> {line}" for line in lines)
-
-    elif block_type == "divider":
-        return f"{indent_str}---"
-
-    elif block_type == "image":
-        image_data = data
-        url = ""
-        if image_data.get("type") == "external":
-            url = image_data.get("external", {}).get("url", "")
-        elif image_data.get("type") == "file":
-            url = image_data.get("file", {}).get("url", "")
-
-        caption_list = image_data.get("caption", [])
-        caption = _rich_text_to_markdown(caption_list) if caption_list else ""
-        alt = caption or "image"
-        return f"{indent_str}![{alt}]({url})"
-
-    elif block_type == "table":
-        return _table_to_markdown(data, indent_str)
-
-    elif block_type == "table_row":
-        # Handled by table block
-        return ""
 
-    elif block_type == "equation":
-        expression = data.get("expression", "")
-        return f"{indent_str}$$\n{expression}\n$$"
+def _render_quote(data: dict, indent: int) -> str:
+    prefix = f"{'    ' * indent}> "
+    text = _rich_text_to_markdown(data.get("rich_text", []))
+    # Prefix every line, including the first
+    return prefix + text.replace("\n", "\n" + prefix)
+
+
+def _render_divider(data: dict, indent: int) -> str:
+    return f"{'    ' * indent}---"
+
+
+def _render_image(data: dict, indent: int) -> str:
+    url = ""
+    if data.get("type") == "external":
+        url = data.get("external", {}).get("url", "")
+    elif data.get("type") == "file":
+        url = data.get("file", {}).get("url", "")
+
+    caption_list = data.get("caption", [])
+    caption = _rich_text_to_markdown(caption_list) if caption_list else ""
+    alt = caption or "image"
+    return f"{'    ' * indent}![{alt}]({url})"
 
-    elif block_type == "callout":
-        return _callout_to_markdown(data, indent_str)
 
-    return ""
+def _render_table(data: dict, indent: int) -> str:
+    return _table_to_markdown(data, "    " * indent)
+
+
+def _render_equation(data: dict, indent: int) -> str:
+    expression = data.get("expression", "")
+    return f"{'    ' * indent}$$\n{expression}\n$$"
+
+
+def _render_callout(data: dict, indent: int) -> str:
+    return _callout_to_markdown(data, "    " * indent)
+
+
+# Dispatch table: block type -> renderer. Block types not listed here
+# (including table_row, which is rendered by its table) produce no output.
+_BLOCK_RENDERERS: dict[str, Callable[[dict, int], str]] = {
+    "paragraph": _render_paragraph,
+    "heading_1": partial(_render_heading, "#"),
+    "heading_2": partial(_render_heading, "##"),
+    "heading_3": partial(_render_heading, "###"),
+    "bulleted_list_item": partial(_render_list_item, "-"),
+    "numbered_list_item": partial(_render_list_item, "1."),
+    "to_do": _render_to_do,
+    "code": _render_code,
+    "quote": _render_quote,
+    "divider": _render_divider,
+    "image": _render_image,
+    "table": _render_table,
+    "equation": _render_equation,
+    "callout": _render_callout,
+}
 
 
 def _table_to_markdown(data: dict, indent_str: str = "") -> str:
@@ -187,6 +199,22 @@ def _table_to_markdown(data: dict, indent_str: str = "") -> str:
     return "\n".join(lines)
 
 
+# Reverse lookup from callout emoji to admonition type
+ICON_TO_ADMON = {
+    "📝": "note",
+    "ℹ️": "info",
+    "💡": "tip",
+    "❗": "important",
+    "⚠️": "warning",
+    "🔴": "danger",
+    "❌": "error",
+    "🐛": "bug",
+    "📋": "example",
+    "💬": "quote",
+    "📌": "footnote",
+}
+
+
 def _callout_to_markdown(data: dict, indent_str: str = "") -> str:
     """Convert Notion callout block to Markdown admonition."""
     rich_text = data.get("rich_text", [])
@@ -195,22 +223,7 @@ def _callout_to_markdown(data: dict, indent_str: str = "") -> str:
     # Try to determine admonition type from icon
     admon_type = "note"
     if icon_data.get("type") == "emoji":
-        emoji = icon_data.get("emoji", "")
-        # Reverse lookup from emoji to type
-        icon_to_type = {
-            "📝": "note",
-            "ℹ️": "info",
-            "💡": "tip",
-            "❗": "important",
-            "⚠️": "warning",
-            "🔴": "danger",
-            "❌": "error",
-            "🐛": "bug",
-            "📋": "example",
-            "💬": "quote",
-            "📌": "footnote",
-        }
-        admon_type = icon_to_type.get(emoji, "note")
+        admon_type = ICON_TO_ADMON.get(icon_data.get("emoji", ""), "note")
 
     text = _rich_text_to_markdown(rich_text)
 
@@ -0,0 +1,10 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Keep plain runs correctness-only; --benchmark-only overrides this
+    if config.pluginmanager.hasplugin("benchmark"):
+        config.option.benchmark_skip = True
@@ -0,0 +1,14 @@
+"""Builders for Notion API objects used in tests."""
+
+
+def _block(block_type: str, payload: dict) -> dict:
+    """Build a Notion block of the given type."""
+    return {"object": "block", "type": block_type, block_type: payload}
+
+
+def _rt(text: str, **annotations) -> dict:
+    """Build a rich_text item, with annotations only if any are given."""
+    item: dict = {"plain_text": text}
+    if annotations:
+        item["annotations"] = annotations
+    return item
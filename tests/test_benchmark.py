@@ -0,0 +1,72 @@
+"""Benchmarks for Notion to Markdown conversion.
+
+Skipped unless pytest-benchmark is installed, and skipped by plain test
+runs even then (see conftest.py). Run only the benchmarks with:
+
+    uv run --with pytest-benchmark pytest tests/test_benchmark.py --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from marknotion import blocks_to_markdown
+
+from tests.helpers import _block, _rt
+
+
+HEADINGS = [
+    _block("heading_1", {"rich_text": [_rt("Title")]}),
+    _block("heading_2", {"rich_text": [_rt("Section")]}),
+    _block("heading_3", {"rich_text": [_rt("Subsection")]}),
+]
+
+PARAGRAPHS = [
+    _block("paragraph", {"rich_text": [_rt("A plain paragraph of text.")]}),
+    _block("paragraph", {"rich_text": [_rt("Another, slightly longer paragraph.")]}),
+]
+
+LISTS = [
+    _block("bulleted_list_item", {"rich_text": [_rt("Bullet")]}),
+    _block("numbered_list_item", {"rich_text": [_rt("Number")]}),
+    _block("to_do", {"rich_text": [_rt("Task")], "checked": False}),
+    _block(
+        "bulleted_list_item",
+        {
+            "rich_text": [_rt("Parent")],
+            "children": [_block("bulleted_list_item", {"rich_text": [_rt("Child")]})],
+        },
+    ),
+]
+
+INLINE_FORMATTING = [
+    _block(
+        "paragraph",
+        {
+            "rich_text": [
+                _rt("plain "),
+                _rt("bold", bold=True),
+                _rt(" and "),
+                _rt("italic", italic=True),
+                _rt(" with "),
+                _rt("code", code=True),
+                {**_rt("link"), "href": "https://example.com"},
+                _rt("gone", strikethrough=True),
+            ]
+        },
+    ),
+]
+
+
+@pytest.mark.benchmark(group="convert")
+@pytest.mark.parametrize(
+    "blocks",
+    [HEADINGS, PARAGRAPHS, LISTS, INLINE_FORMATTING],
+    ids=["headings", "paragraphs", "lists", "inline_formatting"],
+)
+def test_bench_blocks_to_markdown(benchmark, blocks):
+    page = blocks * 100
+    result = benchmark.pedantic(
+        blocks_to_markdown, args=(page,), rounds=50, iterations=10, warmup_rounds=5
+    )
+    assert result
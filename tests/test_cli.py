@@ -0,0 +1,112 @@
+"""Tests for CLI helpers."""
+
+import asyncio
+
+import pytest
+from marknotion.cli import (
+    _extract_id_from_url,
+    _fetch_nested_children_async,
+    normalize_page_id,
+)
+
+PAGE_ID = "abc123de-f456-7890-1234-56789012abcd"
+HEX_ID = "abc123def4567890123456789012abcd"
+
+
+class TestNormalizePageId:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            PAGE_ID,
+            HEX_ID,
+            HEX_ID.upper(),
+            f"https://www.notion.so/My-Page-{HEX_ID}?v=123#heading",
+            f"https://www.notion.so/{HEX_ID}",
+        ],
+        ids=["dashed", "bare_hex", "uppercase", "title_url_with_suffixes", "bare_url"],
+    )
+    def test_valid(self, value):
+        assert normalize_page_id(value) == PAGE_ID
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "abc123",
+            "https://www.notion.so/short-abc123",
+            HEX_ID[:-1] + "g",
+            f"https://www.notion.so/My-Page-{HEX_ID[:-1]}g",
+            " " + HEX_ID[1:],
+        ],
+        ids=["short_id", "short_url_path", "non_hex", "non_hex_url", "whitespace"],
+    )
+    def test_invalid(self, value):
+        assert normalize_page_id(value) is None
+
+
+class TestExtractIdFromUrl:
+    def test_title_url(self):
+        assert _extract_id_from_url(f"https://www.notion.so/Title-{HEX_ID}") == PAGE_ID
+
+    @pytest.mark.parametrize("url", ["", "https://www.notion.so/abc"])
+    def test_no_id(self, url):
+        assert _extract_id_from_url(url) == ""
+
+
+def _child(block_id: str, has_children: bool = False) -> dict:
+    """Build a paragraph block as returned by the Notion API."""
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "has_children": has_children,
+        "paragraph": {"rich_text": []},
+    }
+
+
+class FakeClient:
+    """Serves block children from a dict and records which IDs were fetched."""
+
+    def __init__(self, children: dict[str, list[dict]]):
+        self.children = children
+        self.fetched: list[str] = []
+
+    async def abatch_get_children(self, block_ids: list[str]) -> list[list[dict]]:
+        self.fetched.extend(block_ids)
+        return [self.children[block_id] for block_id in block_ids]
+
+
+class TestFetchNestedChildren:
+    def test_three_levels(self):
+        blocks = [_child("a", has_children=True)]
+        client = FakeClient({
+            "a": [_child("b", has_children=True)],
+            "b": [_child("c", has_children=True)],
+            "c": [_child("d")],
+        })
+        result = asyncio.run(_fetch_nested_children_async(client, blocks))
+
+        b = result[0]["paragraph"]["children"][0]
+        c = b["paragraph"]["children"][0]
+        d = c["paragraph"]["children"][0]
+        assert (b["id"], c["id"], d["id"]) == ("b", "c", "d")
+        assert "children" not in d["paragraph"]
+
+    def test_input_order(self):
+        blocks = [_child(block_id, has_children=True) for block_id in "xyz"]
+        client = FakeClient({
+            "x": [_child("x1"), _child("x2")],
+            "y": [_child("y1")],
+            "z": [_child("z1"), _child("z2"), _child("z3")],
+        })
+        result = asyncio.run(_fetch_nested_children_async(client, blocks))
+
+        assert [b["id"] for b in result] == ["x", "y", "z"]
+        assert [
+            [c["id"] for c in b["paragraph"]["children"]] for b in result
+        ] == [["x1", "x2"], ["y1"], ["z1", "z2", "z3"]]
+
+    def test_skips_blocks_without_children(self):
+        blocks = [_child("a"), _child("b", has_children=True), _child("c")]
+        client = FakeClient({"b": [_child("b1"), _child("b2", has_children=True)], "b2": []})
+        asyncio.run(_fetch_nested_children_async(client, blocks))
+
+        assert client.fetched == ["b", "b2"]
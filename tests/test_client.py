@@ -0,0 +1,42 @@
+"""Tests for the Notion API client wrapper."""
+
+import asyncio
+
+from marknotion import NotionClient
+
+
+class TestAsyncClient:
+    def test_not_created_until_used(self):
+        client = NotionClient(token="secret")
+        assert client._async_client is None
+
+    def test_usable_after_aclose(self):
+        client = NotionClient(token="secret")
+        first = client.async_client
+        asyncio.run(client.aclose())
+        assert first.client.is_closed
+
+        second = client.async_client
+        assert second is not first
+        assert not second.client.is_closed
+        asyncio.run(client.aclose())
+
+    def test_aclose_without_use(self):
+        client = NotionClient(token="secret")
+        asyncio.run(client.aclose())
+        assert client._async_client is None
+
+
+class TestBatchGetChildren:
+    def test_results_in_input_order(self):
+        client = NotionClient(token="secret")
+        delays = {"a": 0.03, "b": 0.01, "c": 0.02, "d": 0.0}
+
+        async def fake_get_children(block_id):
+            await asyncio.sleep(delays[block_id])
+            return [{"id": f"{block_id}1"}]
+
+        client.aget_block_children = fake_get_children
+        result = asyncio.run(client.abatch_get_children(list(delays)))
+
+        assert result == [[{"id": "a1"}], [{"id": "b1"}], [{"id": "c1"}], [{"id": "d1"}]]
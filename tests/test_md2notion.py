@@ -29,6 +29,17 @@ class TestParagraph:
         assert blocks[0]["type"] == "paragraph"
         assert blocks[0]["paragraph"]["rich_text"][0]["plain_text"] == "Hello world"
 
+    def test_plain_paragraph_rich_text_shape(self):
+        blocks = markdown_to_blocks("Just text")
+        assert blocks[0]["paragraph"]["rich_text"] == [
+            {
+                "type": "text",
+                "text": {"content": "Just text"},
+                "plain_text": "Just text",
+                "href": None,
+            }
+        ]
+
     def test_multiple_paragraphs(self):
         blocks = markdown_to_blocks("First\n\nSecond")
         assert len(blocks) == 2
@@ -55,6 +66,15 @@ class TestInlineFormatting:
         assert rich_text["plain_text"] == "code"
         assert rich_text["annotations"]["code"] is True
 
+    def test_nested_annotations(self):
+        blocks = markdown_to_blocks("**bold *both* bold** plain")
+        rich_text = blocks[0]["paragraph"]["rich_text"]
+        assert [rt["plain_text"] for rt in rich_text] == ["bold ", "both", " bold", " plain"]
+        assert rich_text[0]["annotations"] == {"bold": True}
+        assert rich_text[1]["annotations"] == {"bold": True, "italic": True}
+        assert rich_text[2]["annotations"] == {"bold": True}
+        assert "annotations" not in rich_text[3]
+
     def test_link(self):
         blocks = markdown_to_blocks("[text](https://example.com)")
         rich_text = blocks[0]["paragraph"]["rich_text"][0]
@@ -251,6 +271,21 @@ class TestNestedLists:
         children = blocks[0]["numbered_list_item"].get("children", [])
         assert len(children) == 2
 
+    def test_deeply_nested_list(self):
+        md = """- Level 1
+    - Level 2
+        - [x] Level 3
+- Sibling"""
+        blocks = markdown_to_blocks(md)
+        assert len(blocks) == 2
+        level_2 = blocks[0]["bulleted_list_item"]["children"]
+        assert len(level_2) == 1
+        level_3 = level_2[0]["bulleted_list_item"]["children"]
+        assert level_3[0]["type"] == "to_do"
+        assert level_3[0]["to_do"]["checked"] is True
+        assert level_3[0]["to_do"]["rich_text"][0]["plain_text"] == "Level 3"
+        assert "children" not in blocks[1]["bulleted_list_item"]
+
 
 class TestImage:
     def test_inline_image(self):
@@ -327,3 +362,9 @@ class TestFootnote:
         # Should have footnote as callout
         callouts = [b for b in blocks if b.get("type") == "callout"]
         assert len(callouts) >= 1
+
+    def test_footnotes_do_not_leak_between_calls(self):
+        markdown_to_blocks("Text[^a].\n\n[^a]: First note.")
+        blocks = markdown_to_blocks("Plain text.")
+        assert len(blocks) == 1
+        assert blocks[0]["type"] == "paragraph"
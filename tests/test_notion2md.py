@@ -1,258 +1,127 @@
 """Tests for Notion to Markdown conversion."""
 
 import pytest
-from marknotion import blocks_to_markdown
+from marknotion import blocks_to_markdown, markdown_to_blocks
 
+from tests.helpers import _block, _rt
 
-class TestHeadings:
-    def test_heading_1(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "heading_1",
-                "heading_1": {"rich_text": [{"plain_text": "Hello"}]},
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "# Hello"
-
-    def test_heading_2(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {"rich_text": [{"plain_text": "World"}]},
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "## World"
 
-    def test_heading_3(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {"rich_text": [{"plain_text": "Test"}]},
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "### Test"
+class TestHeadings:
+    @pytest.mark.parametrize("level,text", [(1, "Hello"), (2, "World"), (3, "Test")])
+    def test_heading(self, level, text):
+        blocks = [_block(f"heading_{level}", {"rich_text": [_rt(text)]})]
+        assert blocks_to_markdown(blocks) == f"{'#' * level} {text}"
 
 
 class TestParagraph:
     def test_simple_paragraph(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {"rich_text": [{"plain_text": "Hello world"}]},
-            }
-        ]
+        blocks = [_block("paragraph", {"rich_text": [_rt("Hello world")]})]
         assert blocks_to_markdown(blocks) == "Hello world"
 
     def test_multiple_paragraphs(self):
         blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {"rich_text": [{"plain_text": "First"}]},
-            },
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {"rich_text": [{"plain_text": "Second"}]},
-            },
+            _block("paragraph", {"rich_text": [_rt("First")]}),
+            _block("paragraph", {"rich_text": [_rt("Second")]}),
         ]
         assert blocks_to_markdown(blocks) == "First\n\nSecond"
 
 
 class TestInlineFormatting:
-    def test_bold(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"plain_text": "bold", "annotations": {"bold": True}}]
-                },
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "**bold**"
-
-    def test_italic(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"plain_text": "italic", "annotations": {"italic": True}}]
-                },
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "*italic*"
-
-    def test_code_inline(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"plain_text": "code", "annotations": {"code": True}}]
-                },
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "`code`"
+    @pytest.mark.parametrize(
+        "annotation,wrap", [("bold", "**"), ("italic", "*"), ("code", "`")]
+    )
+    def test_annotation(self, annotation, wrap):
+        rich_text = [_rt(annotation, **{annotation: True})]
+        blocks = [_block("paragraph", {"rich_text": rich_text})]
+        assert blocks_to_markdown(blocks) == f"{wrap}{annotation}{wrap}"
 
     def test_link(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"plain_text": "text", "href": "https://example.com"}]
-                },
-            }
-        ]
+        rich_text = [{**_rt("text"), "href": "https://example.com"}]
+        blocks = [_block("paragraph", {"rich_text": rich_text})]
         assert blocks_to_markdown(blocks) == "[text](https://example.com)"
 
 
 class TestLists:
-    def test_bullet_list(self):
+    @pytest.mark.parametrize(
+        "list_type,first,second,expected",
+        [
+            ("bulleted_list_item", "Item 1", "Item 2", "- Item 1\n- Item 2"),
+            ("numbered_list_item", "First", "Second", "1. First\n1. Second"),
+        ],
+    )
+    def test_list(self, list_type, first, second, expected):
         blocks = [
-            {
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {"rich_text": [{"plain_text": "Item 1"}]},
-            },
-            {
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {"rich_text": [{"plain_text": "Item 2"}]},
-            },
+            _block(list_type, {"rich_text": [_rt(first)]}),
+            _block(list_type, {"rich_text": [_rt(second)]}),
         ]
-        assert blocks_to_markdown(blocks) == "- Item 1\n- Item 2"
-
-    def test_ordered_list(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "numbered_list_item",
-                "numbered_list_item": {"rich_text": [{"plain_text": "First"}]},
-            },
-            {
-                "object": "block",
-                "type": "numbered_list_item",
-                "numbered_list_item": {"rich_text": [{"plain_text": "Second"}]},
-            },
-        ]
-        assert blocks_to_markdown(blocks) == "1. First\n1. Second"
+        assert blocks_to_markdown(blocks) == expected
 
 
 class TestCodeBlock:
-    def test_code_block_with_language(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "code",
-                "code": {
-                    "rich_text": [{"plain_text": "print('hello')"}],
-                    "language": "python",
-                },
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "```python\nprint('hello')\n```"
-
-    def test_code_block_plain_text(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "code",
-                "code": {
-                    "rich_text": [{"plain_text": "some code"}],
-                    "language": "plain text",
-                },
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "```\nsome code\n```"
+    @pytest.mark.parametrize(
+        "language,code,expected",
+        [
+            ("python", "print('hello')", "```python\nprint('hello')\n```"),
+            ("plain text", "some code", "```\nsome code\n```"),
+        ],
+    )
+    def test_code_block(self, language, code, expected):
+        blocks = [_block("code", {"rich_text": [_rt(code)], "language": language})]
+        assert blocks_to_markdown(blocks) == expected
 
 
 class TestQuote:
     def test_blockquote(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "quote",
-                "quote": {"rich_text": [{"plain_text": "This is a quote"}]},
-            }
-        ]
+        blocks = [_block("quote", {"rich_text": [_rt("This is a quote")]})]
         assert blocks_to_markdown(blocks) == "> This is a quote"
 
 
 class TestDivider:
     def test_horizontal_rule(self):
-        blocks = [{"object": "block", "type": "divider", "divider": {}}]
+        blocks = [_block("divider", {})]
         assert blocks_to_markdown(blocks) == "---"
 
 
 class TestToDo:
-    def test_unchecked(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "to_do",
-                "to_do": {"rich_text": [{"plain_text": "Task"}], "checked": False},
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "- [ ] Task"
-
-    def test_checked(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "to_do",
-                "to_do": {"rich_text": [{"plain_text": "Done"}], "checked": True},
-            }
-        ]
-        assert blocks_to_markdown(blocks) == "- [x] Done"
+    @pytest.mark.parametrize(
+        "text,checked,expected",
+        [("Task", False, "- [ ] Task"), ("Done", True, "- [x] Done")],
+    )
+    def test_to_do(self, text, checked, expected):
+        blocks = [_block("to_do", {"rich_text": [_rt(text)], "checked": checked})]
+        assert blocks_to_markdown(blocks) == expected
 
 
 class TestStrikethrough:
     def test_strikethrough(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"plain_text": "deleted", "annotations": {"strikethrough": True}}]
-                },
-            }
-        ]
+        blocks = [_block("paragraph", {"rich_text": [_rt("deleted", strikethrough=True)]})]
         assert blocks_to_markdown(blocks) == "~~deleted~~"
 
 
 class TestImage:
     def test_external_image(self):
         blocks = [
-            {
-                "object": "block",
-                "type": "image",
-                "image": {
+            _block(
+                "image",
+                {
                     "type": "external",
                     "external": {"url": "https://example.com/img.png"},
                     "caption": [],
                 },
-            }
+            )
         ]
         assert blocks_to_markdown(blocks) == "![image](https://example.com/img.png)"
 
     def test_image_with_caption(self):
         blocks = [
-            {
-                "object": "block",
-                "type": "image",
-                "image": {
+            _block(
+                "image",
+                {
                     "type": "external",
                     "external": {"url": "https://example.com/img.png"},
-                    "caption": [{"plain_text": "My caption"}],
+                    "caption": [_rt("My caption")],
                 },
-            }
+            )
         ]
         assert blocks_to_markdown(blocks) == "![My caption](https://example.com/img.png)"
 
@@ -260,35 +129,18 @@ class TestImage:
 class TestTable:
     def test_simple_table(self):
         blocks = [
-            {
-                "object": "block",
-                "type": "table",
-                "table": {
+            _block(
+                "table",
+                {
                     "table_width": 2,
                     "has_column_header": True,
                     "has_row_header": False,
                     "children": [
-                        {
-                            "type": "table_row",
-                            "table_row": {
-                                "cells": [
-                                    [{"plain_text": "A"}],
-                                    [{"plain_text": "B"}],
-                                ]
-                            },
-                        },
-                        {
-                            "type": "table_row",
-                            "table_row": {
-                                "cells": [
-                                    [{"plain_text": "1"}],
-                                    [{"plain_text": "2"}],
-                                ]
-                            },
-                        },
+                        _block("table_row", {"cells": [[_rt("A")], [_rt("B")]]}),
+                        _block("table_row", {"cells": [[_rt("1")], [_rt("2")]]}),
                     ],
                 },
-            }
+            )
         ]
         result = blocks_to_markdown(blocks)
         assert "| A" in result
@@ -299,21 +151,9 @@ class TestTable:
 
 class TestNestedLists:
     def test_nested_bullet_list(self):
+        child = _block("bulleted_list_item", {"rich_text": [_rt("Child")]})
         blocks = [
-            {
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [{"plain_text": "Parent"}],
-                    "children": [
-                        {
-                            "object": "block",
-                            "type": "bulleted_list_item",
-                            "bulleted_list_item": {"rich_text": [{"plain_text": "Child"}]},
-                        }
-                    ],
-                },
-            }
+            _block("bulleted_list_item", {"rich_text": [_rt("Parent")], "children": [child]})
         ]
         result = blocks_to_markdown(blocks)
         assert "- Parent" in result
@@ -322,30 +162,17 @@ class TestNestedLists:
 
 class TestEquation:
     def test_block_equation(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "equation",
-                "equation": {"expression": "E = mc^2"},
-            }
-        ]
+        blocks = [_block("equation", {"expression": "E = mc^2"})]
         result = blocks_to_markdown(blocks)
         assert "$$" in result
         assert "E = mc^2" in result
 
     def test_inline_equation(self):
-        blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {"type": "text", "plain_text": "Formula: "},
-                        {"type": "equation", "equation": {"expression": "x^2"}, "plain_text": "x^2"},
-                    ]
-                },
-            }
+        rich_text = [
+            {"type": "text", "plain_text": "Formula: "},
+            {"type": "equation", "equation": {"expression": "x^2"}, "plain_text": "x^2"},
         ]
+        blocks = [_block("paragraph", {"rich_text": rich_text})]
         result = blocks_to_markdown(blocks)
         assert "$x^2$" in result
 
@@ -353,14 +180,13 @@ class TestEquation:
 class TestCallout:
     def test_callout_note(self):
         blocks = [
-            {
-                "object": "block",
-                "type": "callout",
-                "callout": {
-                    "rich_text": [{"plain_text": "This is a note"}],
+            _block(
+                "callout",
+                {
+                    "rich_text": [_rt("This is a note")],
                     "icon": {"type": "emoji", "emoji": "📝"},
                 },
-            }
+            )
         ]
         result = blocks_to_markdown(blocks)
         assert "!!! note" in result
@@ -368,14 +194,13 @@ class TestCallout:
 
     def test_callout_warning(self):
         blocks = [
-            {
-                "object": "block",
-                "type": "callout",
-                "callout": {
-                    "rich_text": [{"plain_text": "Warning message"}],
+            _block(
+                "callout",
+                {
+                    "rich_text": [_rt("Warning message")],
                     "icon": {"type": "emoji", "emoji": "⚠️"},
                 },
-            }
+            )
         ]
         result = blocks_to_markdown(blocks)
         assert "!!! warning" in result
@@ -385,25 +210,61 @@ class TestRoundTrip:
     """Test that markdown -> blocks -> markdown preserves content."""
 
     def test_simple_roundtrip(self):
-        from marknotion import markdown_to_blocks
-
         original = "# Title\n\nSome text"
         blocks = markdown_to_blocks(original)
         result = blocks_to_markdown(blocks)
         assert result == original
 
     def test_list_roundtrip(self):
-        from marknotion import markdown_to_blocks
-
         original = "- Item 1\n- Item 2\n- Item 3"
         blocks = markdown_to_blocks(original)
         result = blocks_to_markdown(blocks)
         assert result == original
 
     def test_strikethrough_roundtrip(self):
-        from marknotion import markdown_to_blocks
-
         original = "~~deleted text~~"
         blocks = markdown_to_blocks(original)
         result = blocks_to_markdown(blocks)
         assert "~~deleted text~~" in result
+
+
+# (block, expected Markdown) pairs converted together by TestBulkConversion.
+# No two list items are adjacent, so every pair is separated by a blank line.
+BULK_CASES = [
+    (_block("heading_1", {"rich_text": [_rt("Hello")]}), "# Hello"),
+    (_block("paragraph", {"rich_text": [_rt("Hello world")]}), "Hello world"),
+    (_block("paragraph", {"rich_text": [_rt("bold", bold=True)]}), "**bold**"),
+    (_block("bulleted_list_item", {"rich_text": [_rt("Item")]}), "- Item"),
+    (
+        _block("code", {"rich_text": [_rt("print('hello')")], "language": "python"}),
+        "```python\nprint('hello')\n```",
+    ),
+    (_block("quote", {"rich_text": [_rt("This is a quote")]}), "> This is a quote"),
+    (_block("divider", {}), "---"),
+    (_block("to_do", {"rich_text": [_rt("Task")], "checked": True}), "- [x] Task"),
+    (
+        _block(
+            "image",
+            {"type": "external", "external": {"url": "https://example.com/img.png"}},
+        ),
+        "![image](https://example.com/img.png)",
+    ),
+    (_block("equation", {"expression": "E = mc^2"}), "$$\nE = mc^2\n$$"),
+    (
+        _block(
+            "callout",
+            {"rich_text": [_rt("This is a note")], "icon": {"type": "emoji", "emoji": "📝"}},
+        ),
+        "!!! note\n    This is a note",
+    ),
+]
+ALL_BLOCKS = [block for block, _ in BULK_CASES]
+EXPECTED = "\n\n".join(markdown for _, markdown in BULK_CASES)
+
+
+class TestBulkConversion:
+    @pytest.mark.parametrize("copies", [1, 500])
+    def test_bulk_conversion(self, copies):
+        """One call renders each block as expected, separated by blank lines."""
+        result = blocks_to_markdown(ALL_BLOCKS * copies)
+        assert result == "\n\n".join([EXPECTED] * copies)